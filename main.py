@@ -16,81 +16,171 @@ All extracted sections are stored in a dictionary for easy access.
 
 Usage:
     - Manually set the PDF file path in the 'pdf_path' variable.
+    - Use 'parse_resumes' to parse a batch of PDF files in parallel.
 """
 
+import concurrent.futures
+import copy
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
 import os
+import tempfile
+from typing import List, Optional
+import resume_parser
 from resume_parser import (
-    extract_text_from_pdf,
     extract_sections_with_font_info,
     extract_name,
     extract_summary,
     extract_accounts_from_resume,
-    extract_skills,
-    extract_education,
-    extract_certifications,
-    extract_projects,
-    extract_work_experience
+    extract_section_details
 )
 
-def parse_resume(pdf_path: str) -> dict:
+logger = logging.getLogger(__name__)
+
+def _parser_fingerprint() -> str:
+    """
+    Hashes the parser sources, so cached results are invalidated whenever they change.
+
+    Returns:
+        str: A short hex digest of `resume_parser.py` and this file.
+    """
+    sha = hashlib.sha1()
+    for path in (resume_parser.__file__, __file__):
+        with open(path, 'rb') as file:
+            sha.update(file.read())
+    return sha.hexdigest()[:12]
+
+# Parsed resumes are cached on disk by the SHA-1 of the PDF contents, under a directory
+# keyed by the parser sources. Bump CACHE_VERSION only if the cache file format changes.
+# Set the RESUME_PARSER_NO_CACHE environment variable to disable the cache.
+CACHE_VERSION = 1
+CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "resume_parser", f"v{CACHE_VERSION}-{_parser_fingerprint()}"
+)
+CACHE_DISABLE_ENV = "RESUME_PARSER_NO_CACHE"
+
+def parse_resume(pdf_path: str, use_cache: bool = True) -> dict:
     """
     Parses the resume from the provided PDF file and extracts key sections into a dictionary.
 
+    Results are memoized by the hash of the file contents, in memory and under
+    CACHE_DIR, so parsing the same resume again does not re-read the PDF structure.
+
+    Args:
+        pdf_path (str): The path to the PDF file containing the resume.
+        use_cache (bool): Whether to use the cache. It is also disabled when the
+            RESUME_PARSER_NO_CACHE environment variable is set.
+
+    Returns:
+        dict: A dictionary containing the extracted sections of the resume.
+    """
+    if not use_cache or os.environ.get(CACHE_DISABLE_ENV):
+        return _parse_resume_uncached(pdf_path)
+
+    with open(pdf_path, 'rb') as file:
+        digest = hashlib.sha1(file.read()).hexdigest()
+
+    # Copy so callers cannot mutate the cached result
+    return copy.deepcopy(_parse_resume_by_hash(digest, pdf_path))
+
+def parse_resumes(pdf_paths: List[str], max_workers: Optional[int] = None, use_cache: bool = True) -> List[dict]:
+    """
+    Parses a batch of resumes in parallel, one PDF per worker process at a time.
+
     Args:
+        pdf_paths (list): The paths to the PDF files containing the resumes.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        use_cache (bool): Whether workers use the parse cache (see `parse_resume`).
+
+    Returns:
+        list: The parsed resume dictionaries, in the same order as `pdf_paths`.
+    """
+    parse = functools.partial(parse_resume, use_cache=use_cache)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse, pdf_paths, chunksize=4))
+
+@functools.lru_cache(maxsize=128)
+def _parse_resume_by_hash(digest: str, pdf_path: str) -> dict:
+    """
+    Returns the parsed resume for a file hash, loading it from the disk cache when present.
+
+    Args:
+        digest (str): SHA-1 hex digest of the PDF file contents.
         pdf_path (str): The path to the PDF file containing the resume.
 
     Returns:
         dict: A dictionary containing the extracted sections of the resume.
     """
-    # Extract text from the resume PDF
-    print("Extracting text from PDF...")
-    text = extract_text_from_pdf(pdf_path)
+    cache_path = os.path.join(CACHE_DIR, f"{digest}.json")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache entry: parse the PDF again
+
+    resume_data = _parse_resume_uncached(pdf_path)
+
+    # The cache is best-effort; an unwritable cache directory must not fail the parse.
+    # Entries are written to a temporary file and moved into place, so readers never
+    # see a partially written file, even with concurrent writers or an interrupted dump.
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(resume_data, file)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        pass
+
+    return resume_data
+
+def _parse_resume_uncached(pdf_path: str) -> dict:
+    """
+    Parses the resume from the provided PDF file without consulting any cache.
 
-    # Extract sections with font information (for structured parsing)
-    print("Extracting sections with font information...")
-    sections = extract_sections_with_font_info(pdf_path)
+    Args:
+        pdf_path (str): The path to the PDF file containing the resume.
+
+    Returns:
+        dict: A dictionary containing the extracted sections of the resume.
+    """
+    # Extract text and sections with font information (for structured parsing)
+    logger.debug("Extracting text and sections with font information...")
+    text, sections = extract_sections_with_font_info(pdf_path)
 
     # Extract information for each section
     resume_data = {}
 
     # Extract name
-    print("Extracting name...")
+    logger.debug("Extracting name...")
     name = extract_name(text)
     resume_data['Name'] = name if name else "Not found"
 
     # Extract summary
-    print("Extracting summary...")
+    logger.debug("Extracting summary...")
     summary = extract_summary(text)
     resume_data['Summary'] = summary if summary else "Not found"
 
     # Extract accounts (URLs, emails)
-    print("Extracting accounts (URLs and emails)...")
+    logger.debug("Extracting accounts (URLs and emails)...")
     accounts = extract_accounts_from_resume(text)
     resume_data['Accounts'] = accounts if accounts else "Not found"
 
-    # Extract skills
-    print("Extracting skills...")
-    skills = extract_skills(sections)
-    resume_data['Skills'] = skills if skills else "Not found"
-
-    # Extract education
-    print("Extracting education...")
-    education = extract_education(sections)
-    resume_data['Education'] = education if education else "Not found"
-
-    # Extract certifications
-    print("Extracting certifications...")
-    certifications = extract_certifications(sections)
-    resume_data['Certifications'] = certifications if certifications else "Not found"
-
-    # Extract projects
-    print("Extracting projects...")
-    projects = extract_projects(sections)
-    resume_data['Projects'] = projects if projects else "Not found"
-
-    # Extract work experience
-    print("Extracting work experience...")
-    work_experience = extract_work_experience(sections)
+    # Extract skills, education, certifications, projects and work experience in one pass
+    logger.debug("Extracting skills, education, certifications, projects and work experience...")
+    details = extract_section_details(sections)
+    resume_data['Skills'] = details['skills'] if details['skills'] else "Not found"
+    resume_data['Education'] = details['education'] if details['education'] else "Not found"
+    resume_data['Certifications'] = details['certifications'] if details['certifications'] else "Not found"
+    resume_data['Projects'] = details['projects'] if details['projects'] else "Not found"
+    work_experience = [dataclasses.asdict(entry) for entry in details['work_experience']]
     resume_data['Work Experience'] = work_experience if work_experience else "Not found"
 
     return resume_data
@@ -109,8 +199,8 @@ def main():
         print(f"Error: File '{pdf_path}' not found.")
         return
 
-    # Parse the resume and get the extracted sections
-    resume_data = parse_resume(pdf_path)
+    # Parse the resume and get the extracted sections; a single run gains nothing from the cache
+    resume_data = parse_resume(pdf_path, use_cache=False)
 
     # Print the extracted resume data in a readable format
     print("\nExtracted Resume Data:")
@@ -16,8 +16,7 @@ It analyzes and extracts key sections of a resume, including:
 The parser uses a combination of PDF text extraction techniques and section-based keyword matching to identify and extract relevant content. It is designed to handle common variations in resume formats and layout complexities.
 
 Libraries and Tools:
-    - **PyPDF2**: Used for extracting text from PDFs.
-    - **PyMuPDF (fitz)**: Used to handle advanced PDF parsing and layout extraction.
+    - **PyMuPDF (fitz)**: Used for extracting text from PDFs and to handle advanced PDF parsing and layout extraction.
     - **re**: Regular expressions are used to identify and extract sections based on keywords and patterns.
     - **spacy**: Natural language processing library used to analyze and process the text for key information extraction.
 
@@ -32,7 +31,8 @@ Challenges Addressed:
 
 Functionality:
     - The script defines several helper functions for extracting specific sections, such as `extract_name`, `extract_summary`, `extract_skills`, and others.
-    - It uses the `extract_sections_with_font_info` function to analyze the document's structure, aiding the parser in identifying section boundaries and content.
+    - It uses the `extract_sections_with_font_info` function to read the document text and analyze its structure in a single pass, aiding the parser in identifying section boundaries and content.
+    - The `extract_section_details` function walks the extracted sections once, classifying each section title by keyword lookup and routing its content to every matching extractor.
     - The main function, `parse_resume`, orchestrates the entire parsing process by reading the PDF, calling the relevant extraction functions, and returning a dictionary of the parsed data.
 
 Usage:
@@ -73,83 +73,201 @@ Future Enhancements:
 
 
 
-from typing import Dict, List, Optional, Union
-import PyPDF2
-import fitz  # PyMuPDF
+from bisect import bisect_right
+from collections import namedtuple
+from dataclasses import dataclass, field
+import functools
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import re
-import spacy
 
-# Load the English NLP model from spaCy
-nlp = spacy.load("en_core_web_sm")
+try:
+    import hyperscan  # Optional: accelerates URL/email scanning when installed
+except ImportError:
+    hyperscan = None
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+# Names are expected near the top of the resume, so only this many characters are run through NER
+NAME_HEADER_LENGTH = 500
+
+# A span of text with its font details; tuples are far lighter than per-span dictionaries
+Span = namedtuple("Span", ["text", "font_size", "font_name"])
+
+
+@dataclass(slots=True)
+class WorkExperienceEntry:
     """
-    Extracts all text from a PDF file.
-    
+    A single job extracted from a work experience section.
+
+    Use `dataclasses.asdict` to convert an entry to a plain dictionary.
+    """
+    title: Optional[str] = None
+    company: Optional[str] = None
+    dates: Optional[str] = None
+    responsibilities: List[str] = field(default_factory=list)
+
+
+# Section title keywords used to classify the extracted sections
+SKILL_SECTION_KEYWORDS = ["Skills", "Technical Skills", "Core Competencies"]
+EDUCATION_SECTION_TITLES = ["Education", "Academic Background"]
+CERTIFICATION_SECTION_TITLES = ["Certification", "Certifications", "Licenses"]
+PROJECT_SECTION_TITLES = ["Projects", "Project Experience"]
+WORK_EXPERIENCE_TITLES = ["Work Experience", "Professional Experience", "Employment History"]
+
+# Regular expressions are compiled once at import time rather than on every call
+_TITLE_RE = re.compile(r"^[A-Z]{4,}\b")  # Lines starting with at least 4 uppercase letters
+_SUMMARY_TITLE_RE = re.compile(
+    r"^(Summary|Professional Summary|Career Summary|Executive Summary|Summary of Qualifications|"
+    r"Profile|Professional Profile|Personal Profile|Career Profile|Personal Summary|Overview|"
+    r"Objective|Career Objective|Professional Objective|Statement|Introduction|About Me)\s*$",
+    re.IGNORECASE,
+)
+_NAME_RE = re.compile(r"^[A-Z][a-zA-Z]*\s+[A-Z][a-zA-Z]*$")
+_NAME_LINE_RE = re.compile(r"^[A-Za-z\s]+$")  # Basic pattern to match a name (adjust as needed)
+_ACCOUNTS_PATTERN = r'(https?://)?(www\.)?([a-zA-Z0-9-]+)\.[a-zA-Z]+(/\S*)?|([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+_ACCOUNTS_RE = re.compile(_ACCOUNTS_PATTERN)
+_DATE_RE = re.compile(r'\b(\d{2}/\d{4}|\d{4})\b')
+_DIGITS = frozenset("0123456789")  # ASCII lines without any of these cannot match _DATE_RE
+
+# Lowercased section title keyword -> section type, matched with plain substring search
+SECTION_TITLES: Dict[str, str] = {
+    keyword.lower(): section_type
+    for section_type, keywords in (
+        ("skills", SKILL_SECTION_KEYWORDS),
+        ("education", EDUCATION_SECTION_TITLES),
+        ("certifications", CERTIFICATION_SECTION_TITLES),
+        ("projects", PROJECT_SECTION_TITLES),
+        ("work_experience", WORK_EXPERIENCE_TITLES),
+    )
+    for keyword in keywords
+}
+
+if hyperscan is not None:
+    _ACCOUNTS_DB = hyperscan.Database()
+    _ACCOUNTS_DB.compile(expressions=[_ACCOUNTS_PATTERN.encode()], ids=[0], flags=[0])
+else:
+    _ACCOUNTS_DB = None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_nlp():
+    """
+    Loads the English NLP model from spaCy on first use.
+
+    spaCy is imported lazily so that importing this module, or parsing only the
+    structural sections, does not pay the model load time and memory.
+    Only the named entity recognizer is used, so the other pipes are disabled.
+
+    Returns:
+        spacy.language.Language: The loaded `en_core_web_sm` pipeline.
+    """
+    import spacy
+
+    return spacy.load("en_core_web_sm", disable=["tagger", "parser", "lemmatizer", "attribute_ruler"])
+
+
+# Font name -> whether it is a bold face; resumes typically use only a handful of fonts
+_BOLD_FONT_CACHE: Dict[str, bool] = {}
+
+
+def _is_bold_font(font_name: str) -> bool:
+    """
+    Checks whether a font name denotes a bold face (e.g. "Ubuntu-Bold", "SemiBold", "Arial-bold").
+
+    Each distinct font name is only inspected once; the result is memoized.
+
     Args:
-        pdf_path (str): Path to the PDF file.
-        
+        font_name (str): Font name as reported by PyMuPDF.
+
+    Returns:
+        bool: True if the font name contains "bold" in any case.
+    """
+    is_bold = _BOLD_FONT_CACHE.get(font_name)
+    if is_bold is None:
+        is_bold = _BOLD_FONT_CACHE.setdefault(font_name, "bold" in font_name.lower())
+    return is_bold
+
+
+def _is_title(text: str) -> bool:
+    """
+    Checks whether a line of text looks like a section title.
+
+    Cheap string checks reject most lines before `_TITLE_RE` is consulted; the
+    regex is only needed to confirm the word boundary after the uppercase run.
+
+    Args:
+        text (str): A single line or span of text.
+
     Returns:
-        str: The extracted text as a single string.
+        bool: True if the text starts with at least 4 uppercase letters.
     """
-    with open(pdf_path, 'rb') as file:
-        reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page_num in range(len(reader.pages)):
-            page = reader.pages[page_num]
-            text += page.extract_text()
-    return text
+    head = text[:4]
+    return len(head) == 4 and head.isalpha() and head.isupper() and _TITLE_RE.match(text) is not None
 
 
-def extract_sections_with_font_info(pdf_path: str) -> Dict[str, List[Dict[str, Union[str, float]]]]:
+def extract_sections_with_font_info(pdf_path: str) -> Tuple[str, Dict[str, List[Span]]]:
     """
-    Extracts sections of a PDF with text and font details to assist with identifying 
-    headers and section content.
+    Extracts the full text of a PDF together with its sections, using text and
+    font details to assist with identifying headers and section content.
+
+    The document is opened and parsed once; the plain text and the sections
+    are both built from the same pass over the page blocks.
 
     Args:
         pdf_path (str): Path to the PDF file.
     
     Returns:
-        dict: Dictionary with section headers as keys and content as lists of 
-              dictionaries with "text", "font_size", and "font_name".
+        tuple: The extracted text as a single string, and a dictionary with
+               section headers as keys and content as lists of `Span` tuples
+               with "text", "font_size", and "font_name".
     """
+    import fitz  # PyMuPDF
+
+    # Skip image blocks and expand ligatures (e.g. "ﬂ" -> "fl"), since only text spans are used
+    text_flags = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+
     document = fitz.open(pdf_path)
+    text_lines: List[str] = []
     sections = {}
     current_title = None
     current_content = []
 
-    for page_num in range(len(document)):
-        page = document.load_page(page_num)
-        blocks = page.get_text("dict")["blocks"]
-
-        for block in blocks:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"].strip()
-                        font_size = span["size"]
-                        font_name = span["font"]
-
-                        # If a line is detected as a title
-                        if re.match(r"^[A-Z]{4,}\b.*", text):
-                            if current_title:
-                                sections[current_title] = current_content
-                            current_title = text
-                            current_content = [{"text": text, "font_size": font_size, "font_name": font_name}]
-                        else:
-                            if current_title:
-                                current_content.append({"text": text, "font_size": font_size, "font_name": font_name})
+    # Bind hot-loop callables to locals to avoid repeated global/attribute lookups
+    is_title = _is_title
+    append = current_content.append
+
+    for page in document:
+        blocks = page.get_text("dict", flags=text_flags)["blocks"]
+
+        # Flatten blocks -> lines -> spans once per page
+        lines = [line for block in blocks if "lines" in block for line in block["lines"]]
+        text_lines.extend("".join(span["text"] for span in line["spans"]) for line in lines)
+        spans = [Span(span["text"].strip(), span["size"], span["font"]) for line in lines for span in line["spans"]]
+
+        for span in spans:
+            text = span.text
+            if not text:
+                continue
+
+            # If a line is detected as a title
+            if is_title(text):
+                if current_title:
+                    sections[current_title] = current_content
+                current_title = text
+                current_content = [span]
+                append = current_content.append
+            elif current_title:
+                append(span)
 
     if current_title:
         sections[current_title] = current_content
 
     document.close()
-    return sections
+    return "\n".join(text_lines), sections
 
 
 def extract_name(text: str) -> Optional[str]:
     """
-    Extracts a name from the resume text based on typical name formatting.
+    Extracts a name from the resume text, using spaCy's PERSON entities on the
+    start of the document and falling back to typical name formatting.
 
     Args:
         text (str): Full resume text as a single string.
@@ -157,12 +275,16 @@ def extract_name(text: str) -> Optional[str]:
     Returns:
         Optional[str]: Extracted name or None if not found.
     """
+    doc = _get_nlp()(text[:NAME_HEADER_LENGTH])
+    for ent in doc.ents:
+        if ent.label_ == "PERSON":
+            return " ".join(ent.text.split())
+
     lines = text.splitlines()
-    name_pattern = re.compile(r"^[A-Z][a-zA-Z]*\s+[A-Z][a-zA-Z]*$")
-    
+
     for line in lines:
         line = line.strip()
-        if name_pattern.match(line):
+        if _NAME_RE.match(line):
             return line
 
     return None
@@ -178,40 +300,66 @@ def extract_summary(text: str) -> str:
     Returns:
         str: Extracted summary text or an empty string if not found.
     """
-    summary_title_pattern = (
-    r"^(Summary|Professional Summary|Career Summary|Executive Summary|Summary of Qualifications|"
-    r"Profile|Professional Profile|Personal Profile|Career Profile|Personal Summary|Overview|"
-    r"Objective|Career Objective|Professional Objective|Statement|Introduction|About Me)\s*$"
-    )
-
-    uppercase_title_pattern = r"^[A-Z]{4,}\b.*"  # Matches lines that are fully uppercase with more than 4 characters
-    name_pattern = r"^[A-Za-z\s]+$"  # Basic pattern to match a name (adjust as needed)
-
     lines = text.splitlines()
-    summary_text = ""
+    summary_parts: List[str] = []
     name_found = False
     is_capturing = False
 
     for line in lines:
-        if re.match(summary_title_pattern, line, re.IGNORECASE):
+        if _SUMMARY_TITLE_RE.match(line):
             is_capturing = True
             continue
         elif is_capturing:
-            if re.match(uppercase_title_pattern, line):
+            if _is_title(line):
                 break
             elif line.strip():
-                summary_text += line.strip() + " "
+                summary_parts.append(line.strip())
                 if line.strip().endswith('.'):
                     break
-        elif re.match(name_pattern, line) and not name_found:
+        elif _NAME_LINE_RE.match(line) and not name_found:
             name_found = True
         elif name_found and not is_capturing:
-            summary_text = line.strip()
+            summary_parts = [line.strip()]
             is_capturing = True
 
+    return " ".join(summary_parts).strip()
+
+
+def _iter_account_matches(text: str) -> Iterator[re.Match]:
+    """
+    Finds all URL and email matches in the resume text.
+
+    Account matches never span a line break, so when hyperscan is available it is
+    used to find the lines that contain a match and `_ACCOUNTS_RE` is only run on
+    those lines to extract the groups. Otherwise the whole text is scanned with `re`.
+
+    Args:
+        text (str): Full resume text as a single string.
+
+    Returns:
+        Iterator[re.Match]: Each URL or email match, in document order.
+    """
+    if _ACCOUNTS_DB is None:
+        yield from _ACCOUNTS_RE.finditer(text)
+        return
+
+    data = text.encode("utf-8")
+    lines = data.split(b"\n")
+    line_starts = []
+    offset = 0
+    for line in lines:
+        line_starts.append(offset)
+        offset += len(line) + 1
+
+    hit_lines = set()
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+        hit_lines.add(bisect_right(line_starts, end - 1) - 1)
 
+    _ACCOUNTS_DB.scan(data, match_event_handler=on_match)
 
-    return summary_text.strip()
+    for line_index in sorted(hit_lines):
+        yield from _ACCOUNTS_RE.finditer(lines[line_index].decode("utf-8"))
 
 
 def extract_accounts_from_resume(text: str) -> Dict[str, List[str]]:
@@ -224,25 +372,151 @@ def extract_accounts_from_resume(text: str) -> Dict[str, List[str]]:
     Returns:
         dict: A dictionary with account types (domains) as keys and lists of URLs/emails as values.
     """
-    pattern = r'(https?://)?(www\.)?([a-zA-Z0-9-]+)\.[a-zA-Z]+(/\S*)?|([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
     accounts: Dict[str, List[str]] = {}
 
-    matches = re.findall(pattern, text)
-    for match in matches:
-        full_url = ''.join(match[:4])
-        email = match[4]
-        if full_url:
-            domain_name = match[2]
-            if domain_name:
-                accounts.setdefault(domain_name, []).append(full_url)
-        if email:
+    for match in _iter_account_matches(text):
+        domain_name = match.group(3)
+        email = match.group(5)
+        if domain_name:
+            accounts.setdefault(domain_name, []).append(match.group(0))
+        elif email:
             email_domain = email.split('@')[1].split('.')[0]
             accounts.setdefault(email_domain, []).append(email)
 
     return accounts
 
 
-def extract_skills(extracted_sections: Dict[str, List[Dict[str, Union[str, float]]]]) -> List[str]:
+def _classify_section(title: str) -> Set[str]:
+    """
+    Determines which types of section a title introduces.
+
+    A title may name several sections (e.g. "SKILLS & CERTIFICATIONS"), in which
+    case its content belongs to each of them.
+
+    Args:
+        title (str): Section title as extracted from the PDF.
+
+    Returns:
+        set: The matching types among "skills", "education", "certifications",
+             "projects" and "work_experience"; empty if the title is not recognised.
+    """
+    title_lower = title.lower()
+    return {section_type for keyword, section_type in SECTION_TITLES.items() if keyword in title_lower}
+
+
+def _extract_section_items(content: List[Span]) -> List[str]:
+    """
+    Extracts the lines of a section that are set in a smaller font than its title.
+
+    Args:
+        content (list): Section content with font info, starting with the title.
+
+    Returns:
+        list: The text of each content line.
+    """
+    title_size = content[0].font_size
+    return [item.text for item in content[1:] if item.font_size < title_size]
+
+
+def _extract_work_experience_entries(content: List[Span]) -> List[WorkExperienceEntry]:
+    """
+    Extracts job title, company, dates, and responsibilities from a single work experience section.
+
+    Args:
+        content (list): Section content with font info, starting with the title.
+
+    Returns:
+        list: A list of `WorkExperienceEntry` objects containing work experience details.
+    """
+    work_experience = []
+    current_entry = WorkExperienceEntry()
+    collecting_responsibilities = False
+
+    for i, line in enumerate(content[1:]):  # Skip title
+        text = line.text.strip()
+        font_size = line.font_size
+        font_name = line.font_name
+
+        # Determine if the font is bold
+        is_bold = _is_bold_font(font_name)
+
+        # Detect job title (Bold and biggest font size)
+        if is_bold and font_size >= 10:
+            # If a job title is already found, save the previous entry and start a new one
+            if current_entry.title:
+                work_experience.append(current_entry)
+                current_entry = WorkExperienceEntry()
+            
+            current_entry.title = text
+            collecting_responsibilities = False
+
+        # Detect company name (same size as title but not bold)
+        elif font_size >= 10 and not is_bold and current_entry.title and not current_entry.company:
+            current_entry.company = text
+            collecting_responsibilities = False
+
+        # Detect dates (smaller font size, look for dates or "Present")
+        elif 'Present' in text or (
+            (not text.isascii() or not _DIGITS.isdisjoint(text)) and _DATE_RE.search(text)
+        ):
+            current_entry.dates = text
+            collecting_responsibilities = True  # Start collecting responsibilities after date
+
+        # Collect responsibilities (smaller font size and at least 3 words)
+        elif collecting_responsibilities and font_size < 10:
+            if len(text.split()) > 3:  # Check for more than three words
+                current_entry.responsibilities.append(text)
+
+    # Append the last work experience entry
+    if current_entry.title:
+        work_experience.append(current_entry)
+
+    return work_experience
+
+
+def extract_section_details(sections: Dict[str, List[Span]]) -> Dict[str, list]:
+    """
+    Extracts skills, education, certifications, projects, and work experience in a
+    single walk over the sections, classifying each section title only once.
+
+    Args:
+        sections (dict): Parsed sections with font info.
+
+    Returns:
+        dict: A dictionary keyed by "skills", "education", "certifications", "projects"
+              and "work_experience", each holding the list the matching
+              `extract_*` function would return.
+    """
+    details: Dict[str, list] = {
+        "skills": [],
+        "education": [],
+        "certifications": [],
+        "projects": [],
+        "work_experience": [],
+    }
+    work_experience_found = False
+
+    for title, content in sections.items():
+        section_types = _classify_section(title)
+        if not section_types:
+            continue
+
+        if "work_experience" in section_types:
+            section_types.discard("work_experience")
+            # Only the first matching work experience section is used
+            if not work_experience_found:
+                details["work_experience"] = _extract_work_experience_entries(content)
+                work_experience_found = True
+
+        if section_types:
+            items = _extract_section_items(content)
+            for section_type in section_types:
+                details[section_type] += items
+
+    return details
+
+
+def extract_skills(extracted_sections: Dict[str, List[Span]]) -> List[str]:
     """
     Extracts skills from sections based on keywords typically used in skill section headers.
 
@@ -252,18 +526,16 @@ def extract_skills(extracted_sections: Dict[str, List[Dict[str, Union[str, float
     Returns:
         list: A list of skills found in the resume.
     """
-    skill_section_keywords = ["Skills", "Technical Skills", "Core Competencies"]
     skills: List[str] = []
-    skills_pattern = re.compile(r"(" + "|".join(skill_section_keywords) + ")", re.IGNORECASE)
 
     for title, content in extracted_sections.items():
-        if skills_pattern.search(title):
-            skills += [item["text"] for item in content if item["font_size"] < content[0]["font_size"]]
+        if "skills" in _classify_section(title):
+            skills += _extract_section_items(content)
 
     return skills
 
 
-def extract_education(sections: Dict[str, List[Dict[str, Union[str, float]]]]) -> List[str]:
+def extract_education(sections: Dict[str, List[Span]]) -> List[str]:
     """
     Extracts education details such as degree, institution, and dates.
 
@@ -273,17 +545,16 @@ def extract_education(sections: Dict[str, List[Dict[str, Union[str, float]]]]) -
     Returns:
         list: A list of strings containing education details.
     """
-    education_pattern = re.compile(r"(Education|Academic Background)", re.IGNORECASE)
     education_list: List[str] = []
 
     for title, content in sections.items():
-        if education_pattern.search(title):
-            education_list += [item["text"] for item in content if item["font_size"] < content[0]["font_size"]]
+        if "education" in _classify_section(title):
+            education_list += _extract_section_items(content)
 
     return education_list
 
 
-def extract_certifications(sections: Dict[str, List[Dict[str, Union[str, float]]]]) -> List[str]:
+def extract_certifications(sections: Dict[str, List[Span]]) -> List[str]:
     """
     Extracts certifications from sections labeled with typical certification-related titles.
 
@@ -293,18 +564,16 @@ def extract_certifications(sections: Dict[str, List[Dict[str, Union[str, float]]
     Returns:
         list: A list of certification titles.
     """
-    certification_section_titles = ["Certification", "Certifications", "Licenses"]
-    certification_pattern = re.compile(r"(" + "|".join(certification_section_titles) + ")", re.IGNORECASE)
     certifications: List[str] = []
 
     for title, content in sections.items():
-        if certification_pattern.search(title):
-            certifications += [item["text"] for item in content if item["font_size"] < content[0]["font_size"]]
+        if "certifications" in _classify_section(title):
+            certifications += _extract_section_items(content)
 
     return certifications
 
 
-def extract_projects(sections: Dict[str, List[Dict[str, Union[str, float]]]]) -> List[str]:
+def extract_projects(sections: Dict[str, List[Span]]) -> List[str]:
     """
     Extracts projects from sections labeled with typical project-related titles.
 
@@ -314,18 +583,16 @@ def extract_projects(sections: Dict[str, List[Dict[str, Union[str, float]]]]) ->
     Returns:
         list: A list of project titles.
     """
-    project_section_titles = ["Projects", "Project Experience"]
-    project_pattern = re.compile(r"(" + "|".join(project_section_titles) + ")", re.IGNORECASE)
     projects: List[str] = []
 
     for title, content in sections.items():
-        if project_pattern.search(title):
-            projects += [item["text"] for item in content if item["font_size"] < content[0]["font_size"]]
+        if "projects" in _classify_section(title):
+            projects += _extract_section_items(content)
 
     return projects
 
 
-def extract_work_experience(sections: Dict[str, List[Dict[str, Union[str, float]]]]) -> List[Dict[str, Union[str, List[str]]]]:
+def extract_work_experience(sections: Dict[str, List[Span]]) -> List[WorkExperienceEntry]:
     """
     Extracts work experience details including job title, company, dates, and responsibilities.
 
@@ -333,58 +600,10 @@ def extract_work_experience(sections: Dict[str, List[Dict[str, Union[str, float]
         sections (dict): Parsed sections with font info.
 
     Returns:
-        list: A list of dictionaries containing work experience details.
+        list: A list of `WorkExperienceEntry` objects containing work experience details.
     """
-    work_experience_titles = ["Work Experience", "Professional Experience", "Employment History"]
-    work_experience_pattern = re.compile(r"(" + "|".join(work_experience_titles) + ")", re.IGNORECASE)
-    work_experience = []
-
     for title, content in sections.items():
-        if work_experience_pattern.search(title):
-            current_entry = {
-                'title': None,
-                'company': None,
-                'dates': None,
-                'responsibilities': []
-            }
-            collecting_responsibilities = False
+        if "work_experience" in _classify_section(title):
+            return _extract_work_experience_entries(content)  # Only the first matching section is used
 
-            for i, line in enumerate(content[1:]):  # Skip title
-                text = line['text'].strip()
-                font_size = line['font_size']
-                font_name = line['font_name']
-
-                # Determine if the font is bold
-                is_bold = "Bold" in font_name
-
-                # Detect job title (Bold and biggest font size)
-                if is_bold and font_size >= 10:
-                    # If a job title is already found, save the previous entry and start a new one
-                    if current_entry['title']:
-                        work_experience.append(current_entry)
-                        current_entry = {'title': None, 'company': None, 'dates': None, 'responsibilities': []}
-                    
-                    current_entry['title'] = text
-                    collecting_responsibilities = False
-
-                # Detect company name (same size as title but not bold)
-                elif font_size >= 10 and not is_bold and current_entry['title'] and not current_entry['company']:
-                    current_entry['company'] = text
-                    collecting_responsibilities = False
-
-                # Detect dates (smaller font size, look for dates or "Present")
-                elif re.search(r'\b(\d{2}/\d{4}|\d{4})\b', text) or 'Present' in text:
-                    current_entry['dates'] = text
-                    collecting_responsibilities = True  # Start collecting responsibilities after date
-
-                # Collect responsibilities (smaller font size and at least 3 words)
-                elif collecting_responsibilities and font_size < 10:
-                    if len(text.split()) > 3:  # Check for more than three words
-                        current_entry['responsibilities'].append(text)
-
-            # Append the last work experience entry
-            if current_entry['title']:
-                work_experience.append(current_entry)
-            break  # Break after finding the first matching section
-
-    return work_experience
+    return []
@@ -0,0 +1,104 @@
+"""
+Checks for the resume parsing entry points in main.py, run against the sample resume in `data/`.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("fitz")
+
+import main
+
+SAMPLE_PDF = os.path.join(os.path.dirname(__file__), "..", "data", "Sample Resume for Assessment.pdf")
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Points the disk cache at a temporary directory and clears the in-memory cache."""
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv(main.CACHE_DISABLE_ENV, raising=False)
+    monkeypatch.setattr(main, "CACHE_DIR", str(directory))
+    main._parse_resume_by_hash.cache_clear()
+    yield directory
+    main._parse_resume_by_hash.cache_clear()
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Replaces the uncached parse with a stub that records each call."""
+    calls = []
+
+    def fake_parse(pdf_path):
+        calls.append(pdf_path)
+        return {"Name": "Jane Doe", "Skills": ["Python"]}
+
+    monkeypatch.setattr(main, "_parse_resume_uncached", fake_parse)
+    return calls
+
+
+def test_cached_result_is_equal_and_isolated(cache_dir, parse_calls):
+    first = main.parse_resume(SAMPLE_PDF)
+    first["Skills"].append("Mutated")
+
+    second = main.parse_resume(SAMPLE_PDF)
+
+    assert second == {"Name": "Jane Doe", "Skills": ["Python"]}
+    assert len(parse_calls) == 1
+
+
+def test_disk_cache_is_reused_across_processes(cache_dir, parse_calls):
+    main.parse_resume(SAMPLE_PDF)
+    main._parse_resume_by_hash.cache_clear()
+
+    assert main.parse_resume(SAMPLE_PDF) == {"Name": "Jane Doe", "Skills": ["Python"]}
+    assert len(parse_calls) == 1
+
+
+def test_corrupt_cache_entry_is_reparsed(cache_dir, parse_calls):
+    main.parse_resume(SAMPLE_PDF)
+    (entry,) = cache_dir.glob("*.json")
+    entry.write_text('{"Name": "Jane', encoding="utf-8")
+    main._parse_resume_by_hash.cache_clear()
+
+    assert main.parse_resume(SAMPLE_PDF) == {"Name": "Jane Doe", "Skills": ["Python"]}
+    assert len(parse_calls) == 2
+    assert entry.read_text(encoding="utf-8").startswith('{"Name": "Jane Doe"')
+
+
+def test_cache_leaves_no_temporary_files(cache_dir, parse_calls):
+    main.parse_resume(SAMPLE_PDF)
+
+    assert [path.suffix for path in cache_dir.iterdir()] == [".json"]
+
+
+def test_cache_can_be_disabled(cache_dir, parse_calls, monkeypatch):
+    main.parse_resume(SAMPLE_PDF, use_cache=False)
+    monkeypatch.setenv(main.CACHE_DISABLE_ENV, "1")
+    main.parse_resume(SAMPLE_PDF)
+
+    assert len(parse_calls) == 2
+    assert not cache_dir.exists()
+
+
+def test_parse_resumes_matches_parse_resume(tmp_path):
+    pytest.importorskip("en_core_web_sm")
+    import fitz
+
+    other_pdf = str(tmp_path / "other.pdf")
+    document = fitz.open()
+    page = document.new_page()
+    for offset, (text, size) in enumerate([("Jane Doe", 14), ("SKILLS", 14), ("Rust", 9)]):
+        page.insert_text((50, 50 + 20 * offset), text, fontsize=size)
+    document.save(other_pdf)
+    document.close()
+
+    results = main.parse_resumes([SAMPLE_PDF, other_pdf], max_workers=1, use_cache=False)
+
+    assert results == [
+        main.parse_resume(SAMPLE_PDF, use_cache=False),
+        main.parse_resume(other_pdf, use_cache=False),
+    ]
+    assert results[0] != results[1]
+    assert results[1]["Skills"] == ["Rust"]
@@ -0,0 +1,96 @@
+"""
+Checks for the resume_parser helpers, run against the sample resume in `data/`.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("fitz")
+
+import resume_parser
+
+SAMPLE_PDF = os.path.join(os.path.dirname(__file__), "..", "data", "Sample Resume for Assessment.pdf")
+
+
+@pytest.fixture(scope="module")
+def sample_text():
+    """Full text of the sample resume."""
+    text, _ = resume_parser.extract_sections_with_font_info(SAMPLE_PDF)
+    return text
+
+
+def test_hyperscan_account_scan_matches_re(sample_text):
+    """The hyperscan fast path must yield exactly the matches of `_ACCOUNTS_RE.finditer`."""
+    if resume_parser._ACCOUNTS_DB is None:
+        pytest.skip("hyperscan is not installed")
+
+    fast = [match.group(0, 3, 5) for match in resume_parser._iter_account_matches(sample_text)]
+    expected = [match.group(0, 3, 5) for match in resume_parser._ACCOUNTS_RE.finditer(sample_text)]
+    assert fast
+    assert fast == expected
+
+
+def test_accounts_keep_the_full_url(sample_text):
+    accounts = resume_parser.extract_accounts_from_resume(sample_text)
+
+    assert accounts["gmail"] == ["gilbertadjei800@gmail.com"]
+    assert accounts["linkedin"] == ["linkedin.com/in/gilbert-adjei-900ba2110"]
+    assert accounts["github"] == ["github.com/GilbertAbakahAdjei"]
+    assert accounts["medium"] == ["medium.com/@gilbertadjei800"]
+
+
+
+@pytest.mark.parametrize(
+    "font_name, expected",
+    [("X-Bold", True), ("SemiBold", True), ("x-bold", True), ("Regular", False)],
+)
+def test_is_bold_font_ignores_case(font_name, expected):
+    assert resume_parser._is_bold_font(font_name) is expected
+
+
+def _section(title, *rows):
+    """Builds section content: a large bold title followed by (text, font_size, font_name) rows."""
+    return [resume_parser.Span(title, 14.0, "Ubuntu-Bold")] + [resume_parser.Span(*row) for row in rows]
+
+
+def test_combined_section_titles_fill_every_matching_list():
+    sections = {
+        "SKILLS & CERTIFICATIONS": _section("SKILLS & CERTIFICATIONS", ("Python", 9.0, "Ubuntu-Regular")),
+        "PROJECTS & WORK EXPERIENCE": _section(
+            "PROJECTS & WORK EXPERIENCE",
+            ("Data Engineer", 11.0, "Ubuntu-Bold"),
+            ("Acme", 11.0, "Ubuntu-Regular"),
+            ("01/2020 - Present", 7.0, "Ubuntu-Italic"),
+            ("Built the data platform for analytics", 7.0, "Ubuntu-Regular"),
+        ),
+        "EMPLOYMENT HISTORY": _section(
+            "EMPLOYMENT HISTORY",
+            ("Analyst", 11.0, "Ubuntu-Bold"),
+        ),
+    }
+
+    details = resume_parser.extract_section_details(sections)
+
+    assert details["skills"] == ["Python"]
+    assert details["certifications"] == ["Python"]
+    assert details["projects"] == [
+        "Data Engineer",
+        "Acme",
+        "01/2020 - Present",
+        "Built the data platform for analytics",
+    ]
+    # Only the first work experience section is used
+    assert details["work_experience"] == [
+        resume_parser.WorkExperienceEntry(
+            title="Data Engineer",
+            company="Acme",
+            dates="01/2020 - Present",
+            responsibilities=["Built the data platform for analytics"],
+        )
+    ]
+
+    assert resume_parser.extract_skills(sections) == details["skills"]
+    assert resume_parser.extract_certifications(sections) == details["certifications"]
+    assert resume_parser.extract_projects(sections) == details["projects"]
+    assert resume_parser.extract_work_experience(sections) == details["work_experience"]